@@ -44,6 +44,18 @@ class TestMasteredWordsStore:
         mastered_words_s.remove("program")
         assert mastered_words_s.exists("program") is False
 
+    def test_add_many(self, tmp_path):
+        mastered_words_s = MasteredWordStore(tmp_path / "foo.json")
+        mastered_words_s.add("program")
+        mastered_words_s.add_many(["program", "python", "python"])
+        assert sorted(mastered_words_s.all()) == ["program", "python"]
+
+    def test_remove_many(self, tmp_path):
+        mastered_words_s = MasteredWordStore(tmp_path / "foo.json")
+        mastered_words_s.add_many(["program", "python", "java"])
+        mastered_words_s.remove_many(["program", "python"])
+        assert mastered_words_s.all() == ["java"]
+
 
 class TestWordStore:
     def test_get(self, tmp_path):
@@ -64,6 +76,25 @@ class TestWordStore:
         word_store.remove("program")
         assert word_store.count() == 1
 
+    def test_remove_many(self, tmp_path):
+        word_store = WordStore(tmp_path / "foo.json")
+        for s in ["program", "python", "java"]:
+            word_store.add(WordSample.make_empty(s))
+
+        word_store.remove_many(["program", "python", "foo"])
+        assert [obj.word for obj in word_store.all()] == ["java"]
+
+    def test_version(self, tmp_path):
+        word_store = WordStore(tmp_path / "foo.json")
+        v1 = word_store.version
+        assert WordStore(tmp_path / "foo.json").version == v1
+
+        word_store.add(WordSample.make_empty("program"))
+        v2 = word_store.version
+        assert v2 != v1
+        word_store.remove("program")
+        assert word_store.version not in (v1, v2)
+
     def test_list_latest(self, tmp_path):
         word_store = WordStore(tmp_path / "foo.json")
         for i in range(50):
@@ -77,6 +108,10 @@ class TestWordStore:
         # Test list all
         assert len(word_store.list_latest()) == 50
 
+        # Test list in reversed order, the items should starts from "word49"
+        items = word_store.list_latest(limit=10, reverse=True)
+        assert [word.word for word in items] == [f"word{i}" for i in range(49, 39, -1)]
+
     def test_story_words(self, tmp_path):
         word_store = WordStore(tmp_path / "foo.json")
         for s in "Python program language is easy to read and write".split():
@@ -103,6 +138,13 @@ class TestWordStore:
         word_store.add(WordSample.make_empty("python"))
         assert word_store.filter({"foo", "python", "bar"}) == {"python"}
 
+    def test_filter_objects(self, tmp_path):
+        word_store = WordStore(tmp_path / "foo.json")
+        word_store.add(WordSample.make_empty("program"))
+        word_store.add(WordSample.make_empty("python"))
+        objs = list(word_store.filter_objects({"foo", "python", "bar"}))
+        assert [obj.word for obj in objs] == ["python"]
+
     def test_search(self, tmp_path):
         word_store = WordStore(tmp_path / "foo.json")
         word_store.add(WordSample.make_empty("program"))
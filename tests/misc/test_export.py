@@ -0,0 +1,16 @@
+from io import StringIO
+
+from voc_builder.infras.store import get_word_store
+from voc_builder.misc.export import write_voc_csv_rows
+
+
+def test_write_voc_csv_rows(w_sample_world):
+    get_word_store().add(w_sample_world)
+    fp = StringIO()
+    rows = write_voc_csv_rows(fp)
+
+    next(rows)
+    assert fp.getvalue().startswith("#,Word,Pronunciation,Definition")
+    next(rows)
+    assert '1,world,wɔrld,世界,"Hello, world! / 你好，世界！",' in fp.getvalue()
+    assert list(rows) == []
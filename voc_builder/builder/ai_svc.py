@@ -12,6 +12,8 @@ from voc_builder.infras.ai import AIResultMode, PromptText
 
 logger = logging.getLogger()
 
+RE_JSON_OBJECT = re.compile(r"{[\s\S]*}", flags=re.MULTILINE)
+
 
 class WordChoiceModelResp(BaseModel):
     """The word returned by LLM service."""
@@ -200,7 +202,7 @@ EXAMPLE JSON OUTPUT:
 
     def _parse_json_output(self, data: str) -> WordChoiceModelResp:
         """Parse the JSON output to get the word object."""
-        obj = re.search(r"{[\s\S]*}", data, flags=re.MULTILINE)
+        obj = RE_JSON_OBJECT.search(data)
         if not obj:
             raise AIServiceError("Invalid JSON output")
         return WordChoiceModelResp.model_validate_json(obj.group())
@@ -1,9 +1,11 @@
-import json
+import functools
 import logging
-from typing import AsyncGenerator, Dict
+from pathlib import Path
+from typing import AsyncGenerator, Dict, List, Set
 
-from fastapi import APIRouter, Query, Response, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sse_starlette.sse import EventSourceResponse
 from typing_extensions import Annotated
 
@@ -12,7 +14,12 @@ from voc_builder.common.errors import error_codes
 from voc_builder.common.text import tokenize_text
 from voc_builder.exceptions import AIServiceError
 from voc_builder.infras.ai import create_ai_model_config
-from voc_builder.infras.store import get_mastered_word_store, get_word_store
+from voc_builder.infras.store import (
+    MasteredWordStore,
+    WordStore,
+    get_mastered_word_store,
+    get_word_store,
+)
 from voc_builder.system.language import get_target_language
 
 from .ai_svc import (
@@ -54,15 +61,17 @@ async def gen_translation_sse(text: str) -> AsyncGenerator[Dict, None]:
         ):
             yield {
                 "event": "trans_partial",
-                "data": json.dumps({"translated_text": translated_text}),
+                "data": orjson.dumps({"translated_text": translated_text}).decode(),
             }
     except AIServiceError as e:
-        yield {"event": "error", "data": json.dumps({"message": str(e)})}
+        yield {"event": "error", "data": orjson.dumps({"message": str(e)}).decode()}
         return
 
     yield {
         "event": "translation",
-        "data": json.dumps({"text": text, "translated_text": translated_text}),
+        "data": orjson.dumps(
+            {"text": text, "translated_text": translated_text}
+        ).decode(),
     }
 
 
@@ -72,9 +81,10 @@ async def create_word_sample(trans_obj: TranslatedTextInput, response: Response)
     mastered_word_s = get_mastered_word_store()
     word_store = get_word_store()
 
-    orig_words = tokenize_text(trans_obj.orig_text)
-    # Words already in vocabulary book and marked as mastered are treated as "known"
-    known_words = word_store.filter(orig_words) | mastered_word_s.filter(orig_words)
+    # Tokenizing and reading the db are blocking, run them in the threadpool
+    known_words = await run_in_threadpool(
+        get_known_words, trans_obj.orig_text, word_store, mastered_word_s
+    )
 
     try:
         model_config = create_ai_model_config()
@@ -94,7 +104,7 @@ async def create_word_sample(trans_obj: TranslatedTextInput, response: Response)
         orig_text=trans_obj.orig_text,
     )
 
-    validate_result_word(word_sample, trans_obj.orig_text)
+    validate_result_word(word_sample, trans_obj.orig_text, word_store)
 
     word_store.add(word_sample)
     return {
@@ -112,19 +122,13 @@ def find_known_words_by_text(req: GetKnownWordsByTextInput, response: Response):
     orig_words = tokenize_text(req.text)
 
     # Words already in vocabulary book and marked as mastered are treated as "known"
-    existing_words = []
-    for w in word_store.filter(orig_words):
-        word_obj = word_store.get(w)
-        assert word_obj
-        obj = WordSampleOutput.from_db_obj(word_obj.ws)
-        existing_words.append(
-            {"word": obj.word, "simple_definition": obj.simple_definition}
-        )
+    existing_words = [
+        {"word": o.ws.word, "simple_definition": o.ws.get_definitions_str()}
+        for o in word_store.filter_objects(orig_words)
+    ]
 
     mastered_words = mastered_word_s.filter(orig_words)
-    return JSONResponse(
-        {"existing_words": list(existing_words), "mastered_words": list(mastered_words)}
-    )
+    return {"existing_words": existing_words, "mastered_words": list(mastered_words)}
 
 
 @router.post("/api/word_samples/deletion/")
@@ -132,33 +136,57 @@ def delete_word_samples(req: DeleteWordsInput, response: Response):
     """Delete a list of words."""
     word_store = get_word_store()
     mastered_word_s = get_mastered_word_store()
-    for word in req.words:
-        word_store.remove(word)
-        if req.mark_mastered:
-            mastered_word_s.add(word)
+    word_store.remove_many(req.words)
+    if req.mark_mastered:
+        mastered_word_s.add_many(req.words)
     response.status_code = status.HTTP_204_NO_CONTENT
 
 
 @router.get("/api/word_samples/")
-def list_word_samples():
-    """List all word samples in the store."""
+def list_word_samples(request: Request, response: Response):
+    """List all word samples in the store, reply "304 Not Modified" if the client
+    already has the latest version.
+    """
     word_store = get_word_store()
-    words = word_store.list_latest()
-    # Remove the fields not necessary, sort by -date_added
-    words_refined = [
-        {"ws": WordSampleOutput.from_db_obj(obj.ws), "ts_date_added": obj.ts_date_added}
-        for obj in reversed(words)
+    version = word_store.version
+    etag = f'"{version}"'
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (t.strip() for t in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    # Always revalidate, the list changes whenever a word is added or removed
+    response.headers["Cache-Control"] = "no-cache"
+    words_refined = _get_word_samples_output(word_store.file_path, version)
+    return {"words": words_refined, "count": len(words_refined)}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_word_samples_output(file_path: Path, version: str) -> List[Dict]:
+    """Get the serialized word samples for listing, the result is cached until the
+    data version of the store changes.
+
+    :param file_path: The file path of the word store.
+    :param version: The data version of the word store.
+    """
+    words = WordStore(file_path).list_latest(reverse=True)
+    # Remove the fields not necessary
+    return [
+        {
+            "ws": WordSampleOutput.from_db_obj(obj.ws).model_dump(mode="json"),
+            "ts_date_added": obj.ts_date_added,
+        }
+        for obj in words
     ]
-    return {"words": words_refined, "count": len(words)}
 
 
 @router.get("/api/word_samples/recent")
 def list_recent_word_samples():
     """List the most recent word samples in the store."""
     word_store = get_word_store()
-    words = word_store.list_latest(limit=4)
-    # Remove the fields not necessary, sort by -date_added
-    words_refined = [WordSampleOutput.from_db_obj(obj.ws) for obj in reversed(words)]
+    words = word_store.list_latest(limit=4, reverse=True)
+    # Remove the fields not necessary
+    words_refined = [WordSampleOutput.from_db_obj(obj.ws) for obj in words]
     return {"words": words_refined, "count": len(words)}
 
 
@@ -184,7 +212,7 @@ async def manually_save(req: ManuallySelectInput, response: Response):
         orig_text=req.orig_text,
     )
 
-    validate_result_word(word_sample, req.orig_text)
+    validate_result_word(word_sample, req.orig_text, word_store)
 
     word_store.add(word_sample)
     return {
@@ -193,7 +221,20 @@ async def manually_save(req: ManuallySelectInput, response: Response):
     }
 
 
-def validate_result_word(word: WordSample, orig_text: str):
-    """Check if a result word is valid before it can be put into vocabulary book"""
-    if get_word_store().exists(word.word):
+def get_known_words(
+    text: str, word_store: WordStore, mastered_word_s: MasteredWordStore
+) -> Set[str]:
+    """Get the known words in the given text, words already in vocabulary book and
+    marked as mastered are treated as "known".
+    """
+    orig_words = tokenize_text(text)
+    return word_store.filter(orig_words) | mastered_word_s.filter(orig_words)
+
+
+def validate_result_word(word: WordSample, orig_text: str, word_store: WordStore):
+    """Check if a result word is valid before it can be put into vocabulary book
+
+    :param word_store: The word store object, reuse the one the caller already has.
+    """
+    if word_store.exists(word.word):
         raise error_codes.WORD_ALREADY_EXISTS.set_data(word.word)
@@ -6,7 +6,7 @@ from typing import Optional
 
 from rich.console import Console
 
-from voc_builder.misc.export import VocCSVWriter
+from voc_builder.misc.export import write_voc_csv
 
 console = Console()
 
@@ -25,8 +25,8 @@ def handle_export(format: str, file_path: Optional[str]):
     if format == FormatType.CSV.value:
         if file_path:
             with open(file_path, "w", encoding="utf-8") as fp:
-                VocCSVWriter().write_to(fp)
+                write_voc_csv(fp)
                 console.print(f'Exported to "{file_path}" successfully, format: csv.')
         else:
-            VocCSVWriter().write_to(sys.stdout)
+            write_voc_csv(sys.stdout)
         return
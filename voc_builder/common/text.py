@@ -3,10 +3,12 @@
 import re
 from typing import Optional, Set
 
+RE_WORD = re.compile(r"[a-zA-Z-]+")
+
 
 def tokenize_text(text: str) -> Set[str]:
     """Return all words in the given text, words are in lower case"""
-    return {s.group().lower() for s in re.finditer(r"[a-zA-Z-]+", text)}
+    return {w.lower() for w in RE_WORD.findall(text)}
 
 
 def get_word_candidates(text: str, known_words: Optional[Set[str]] = None) -> Set[str]:
@@ -1,6 +1,7 @@
 import copy
 import datetime
 import math
+import os
 import random
 import time
 from dataclasses import asdict, dataclass
@@ -30,7 +31,7 @@ class MasteredWordStore:
 
         :param words: a list of lower cased word.
         """
-        return {word for word in words if self.exists(word)}
+        return set(words) & set(self.all())
 
     def all(self) -> List[str]:
         """Return all mastered words
@@ -47,6 +48,15 @@ class MasteredWordStore:
         MWord = Query()
         return self._db.upsert({"word": word}, MWord.word == word)
 
+    def add_many(self, words: Iterable[str]):
+        """Mark many words as mastered, the db is written only once.
+
+        :param words: Lower cased words.
+        """
+        existing = set(self.all())
+        new_words = [w for w in dict.fromkeys(words) if w not in existing]
+        self._db.insert_multiple({"word": w} for w in new_words)
+
     def remove(self, word: str):
         """Remove a word
 
@@ -55,6 +65,14 @@ class MasteredWordStore:
         MWord = Query()
         self._db.remove(MWord.word == word)
 
+    def remove_many(self, words: Iterable[str]):
+        """Remove many words, the db is written only once.
+
+        :param words: Lower cased words.
+        """
+        MWord = Query()
+        self._db.remove(MWord.word.one_of(list(words)))
+
     def exists(self, word: str):
         """Check if a word exists in current db
 
@@ -95,6 +113,14 @@ class WordStore:
         self.file_path = file_path
         self._db = TinyDB(self.file_path)
 
+    @property
+    def version(self) -> str:
+        """The version of the stored data, it changes whenever the db file is written,
+        no matter which process or store object did it.
+        """
+        st = os.stat(self.file_path)
+        return f"{st.st_mtime_ns}-{st.st_size}"
+
     def pick_quiz_words(self, count: int) -> List[WordSample]:
         """Pick some words for generating quiz.
 
@@ -163,15 +189,18 @@ class WordStore:
                 Word.ws.word == obj.ws.word,
             )
 
-    def list_latest(self, limit: Optional[int] = None) -> List[WordDetailedObj]:
+    def list_latest(
+        self, limit: Optional[int] = None, reverse: bool = False
+    ) -> List[WordDetailedObj]:
         """List latest added words
 
         :param limit: How many words to list, if not given, list all.
+        :param reverse: If True, the latest added word comes first.
         :return: A list of detailed word objects.
         """
-        results = sorted(self.all(), key=lambda obj: obj.ts_date_added)
+        results = sorted(self.all(), key=lambda obj: obj.ts_date_added, reverse=reverse)
         if limit is not None:
-            return results[-limit:]
+            return results[:limit] if reverse else results[-limit:]
         else:
             return results
 
@@ -180,7 +209,18 @@ class WordStore:
 
         :param words: a list of lower cased word.
         """
-        return {word for word in words if self.exists(word)}
+        return set(words) & {d["ws"]["word"] for d in self._db.all()}
+
+    def filter_objects(self, words: Set[str]) -> Iterable[WordDetailedObj]:
+        """Filter the given word list, return the objects of those exists in current db,
+        all the words are matched in one query.
+
+        :param words: a list of lower cased word.
+        :return: A generator of detailed word objects.
+        """
+        Word = Query()
+        for d in self._db.search(Word.ws.word.one_of(list(words))):
+            yield self._to_detailed_obj(d)
 
     def add(self, word: WordSample, ts_date_added: Optional[float] = None):
         """Add a word to the vocabulary book
@@ -246,6 +286,15 @@ class WordStore:
         Word = Query()
         return self._db.remove(Word.ws.word == word)
 
+    def remove_many(self, words: Iterable[str]) -> List[int]:
+        """Remove many words, the db is written only once.
+
+        :param words: Lower cased words.
+        :return: A list of removed doc ID
+        """
+        Word = Query()
+        return self._db.remove(Word.ws.word.one_of(list(words)))
+
     def exists(self, word: str):
         """Check if a word exists in current db
 
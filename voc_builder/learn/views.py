@@ -1,10 +1,10 @@
 import datetime
-import json
-from io import StringIO
-from typing import AsyncGenerator, Dict, List, Literal
+from io import BytesIO, TextIOWrapper
+from typing import AsyncGenerator, Iterator, List, Literal
 
+import orjson
 from fastapi import APIRouter, Query, Response, status
-from sse_starlette.sse import EventSourceResponse
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
 from starlette.responses import StreamingResponse
 from typing_extensions import Annotated
 
@@ -13,7 +13,7 @@ from voc_builder.builder.serializers import WordSampleOutput
 from voc_builder.exceptions import AIServiceError
 from voc_builder.infras.ai import create_ai_model_config
 from voc_builder.infras.store import get_mastered_word_store, get_word_store
-from voc_builder.misc.export import VocCSVWriter
+from voc_builder.misc.export import write_voc_csv_rows
 
 from .ai_svc import get_story
 from .serializers import DeleteMasteredWordsInput
@@ -39,34 +39,46 @@ def create_new_story(words_num: Annotated[Literal["6", "12", "24"], Query(...)])
     return EventSourceResponse(gen_story_sse(words))
 
 
-async def gen_story_sse(words: List[WordSample]) -> AsyncGenerator[Dict, None]:
+async def gen_story_sse(
+    words: List[WordSample],
+) -> AsyncGenerator[ServerSentEvent, None]:
     """Generate the SSE events for the story writing progress."""
     out_words = [WordSampleOutput.from_db_obj(w) for w in words]
-    yield {
-        "event": "words",
-        "data": json.dumps([w.model_dump(mode="json") for w in out_words]),
-    }
+    yield ServerSentEvent(
+        event="words",
+        data=orjson.dumps([w.model_dump(mode="json") for w in out_words]).decode(),
+    )
 
     try:
         model_config = create_ai_model_config()
         async for text in get_story(model_config.model, words):
-            yield {"event": "story_partial", "data": text}
+            yield ServerSentEvent(event="story_partial", data=text)
     except AIServiceError as e:
-        yield {"event": "error", "data": json.dumps({"message": str(e)})}
-    yield {"event": "story", "data": text}
+        yield ServerSentEvent(
+            event="error", data=orjson.dumps({"message": str(e)}).decode()
+        )
+    yield ServerSentEvent(event="story", data=text)
 
 
 @router.get("/api/word_samples/export/")
 def export_words():
     """Export all the word samples."""
-    fp = StringIO()
-    VocCSVWriter().write_to(fp)
-    fp.seek(0)
+
+    def iter_csv() -> Iterator[bytes]:
+        # Use a small binary buffer as the pseudo file, so the rows are encoded into
+        # UTF-8 only once, empty it after each row is written
+        raw = BytesIO()
+        fp = TextIOWrapper(raw, encoding="utf-8", newline="", write_through=True)
+        for _ in write_voc_csv_rows(fp):
+            data = raw.getvalue()
+            raw.seek(0)
+            raw.truncate()
+            yield data
 
     now = datetime.datetime.now()
     filename = now.strftime("ai_vov_words_%Y%m%d_%H%M.csv")
     headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
-    return StreamingResponse(fp, headers=headers)
+    return StreamingResponse(iter_csv(), media_type="text/csv", headers=headers)
 
 
 @router.get("/api/mastered_words/")
@@ -80,6 +92,5 @@ def get_mastered_words():
 def delete_mastered_words(req: DeleteMasteredWordsInput, response: Response):
     """Delete words from the mastered words."""
     mastered_word_s = get_mastered_word_store()
-    for word in req.words:
-        mastered_word_s.remove(word)
+    mastered_word_s.remove_many(req.words)
     response.status_code = status.HTTP_204_NO_CONTENT
@@ -1,41 +1,58 @@
 """Handle exporting related functions"""
 
 import csv
-from typing import TextIO
+from typing import Iterator, TextIO, Tuple
 
 from voc_builder.infras.store import get_word_store
 
+# The header row of the exported CSV file
+HEADER_ROW = (
+    "#",
+    "Word",
+    "Pronunciation",
+    "Definition",
+    "Example sentence / Translation",
+    "Date added",
+)
 
-class VocCSVWriter:
+
+def write_voc_csv(fp: TextIO):
     """Write vocabulary book into CSV file
 
     :param fp: The file object
     """
+    writer = _get_writer(fp)
+    writer.writerow(HEADER_ROW)
+    writer.writerows(_iter_rows())
+
+
+def write_voc_csv_rows(fp: TextIO) -> Iterator[None]:
+    """Write vocabulary book into CSV file row by row, yield after each row has been
+    written, so the caller is able to consume the content progressively.
 
-    header_row = (
-        "#",
-        "Word",
-        "Pronunciation",
-        "Definition",
-        "Example sentence / Translation",
-        "Date added",
-    )
-
-    def write_to(self, fp: TextIO):
-        """Write to the given file object"""
-        self._get_writer(fp).writerow(self.header_row)
-        for i, w in enumerate(get_word_store().all(), start=1):
-            self._get_writer(fp).writerow(
-                (
-                    str(i),
-                    w.word,
-                    w.ws.pronunciation,
-                    w.ws.get_definitions_str(),
-                    "{} / {}".format(w.ws.orig_text, w.ws.translated_text),
-                    w.date_added,
-                )
-            )
-
-    def _get_writer(self, fp: TextIO):
-        """Get the CSV writer obj"""
-        return csv.writer(fp, delimiter=",", quoting=csv.QUOTE_MINIMAL)
+    :param fp: The file object
+    """
+    writer = _get_writer(fp)
+    writer.writerow(HEADER_ROW)
+    yield
+    for row in _iter_rows():
+        writer.writerow(row)
+        yield
+
+
+def _iter_rows() -> Iterator[Tuple[str, ...]]:
+    """Iterate the data rows of all words in the vocabulary book"""
+    for i, w in enumerate(get_word_store().all(), start=1):
+        yield (
+            str(i),
+            w.word,
+            w.ws.pronunciation,
+            w.ws.get_definitions_str(),
+            f"{w.ws.orig_text} / {w.ws.translated_text}",
+            w.date_added,
+        )
+
+
+def _get_writer(fp: TextIO):
+    """Get the CSV writer obj"""
+    return csv.writer(fp, delimiter=",", quoting=csv.QUOTE_MINIMAL)
@@ -4,6 +4,7 @@ import pathlib
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import ValidationError
 from starlette.responses import FileResponse
@@ -22,8 +23,9 @@ from ..common.web.std_err import APIError
 logger = logging.getLogger(__name__)
 
 ROOT_DIR = pathlib.Path(__file__).parent.resolve()
+INDEX_PATH = str(ROOT_DIR / "dist/index.html")
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_exception_handler(ValidationError, pydantic_exception_handler)  # type: ignore
 app.add_exception_handler(RequestValidationError, req_validation_exception_handler)  # type: ignore
@@ -52,4 +54,4 @@ app.add_middleware(
 @app.get("/")
 @app.get("/app/{any_path:path}")
 def index():
-    return FileResponse(str(ROOT_DIR / "dist/index.html"))
+    return FileResponse(INDEX_PATH)
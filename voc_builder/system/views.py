@@ -2,7 +2,6 @@ import logging
 
 import cattrs
 from fastapi import APIRouter, Response
-from fastapi.responses import JSONResponse
 
 import voc_builder
 from voc_builder.infras.store import get_sys_settings_store, get_word_store
@@ -52,17 +51,15 @@ async def get_system_status(response: Response):
         logger.exception("Error checking new version.")
         new_version = None
     words_cnt = get_word_store().count()
-    return JSONResponse(
-        {
-            "version": voc_builder.__version__,
-            "target_language": get_target_language(),
-            "model_settings_initialized": model_settings_initialized,
-            "new_version": new_version,
-            "words_cnt": words_cnt,
-            "story_mode_available": words_cnt >= MIN_WORDS_STORY,
-            "quiz_mode_available": words_cnt >= MIN_WORDS_QUIZ,
-        }
-    )
+    return {
+        "version": voc_builder.__version__,
+        "target_language": get_target_language(),
+        "model_settings_initialized": model_settings_initialized,
+        "new_version": new_version,
+        "words_cnt": words_cnt,
+        "story_mode_available": words_cnt >= MIN_WORDS_STORY,
+        "quiz_mode_available": words_cnt >= MIN_WORDS_QUIZ,
+    }
 
 
 @router.get("/api/settings")
@@ -71,20 +68,18 @@ async def get_settings(response: Response):
     settings = get_sys_settings_store().get_system_settings()
     if not settings:
         settings = build_default_settings()
-    return JSONResponse(
-        {
-            "settings": cattrs.unstructure(settings),
-            "model_options": {
-                "gemini": GEMINI_MODELS,
-                "openai": OPENAI_MODELS,
-                "anthropic": ANTHROPIC_MODELS,
-                "deepseek": DEEPSEEK_MODELS,
-            },
-            "target_language_options": [
-                cattrs.unstructure(lan.value) for lan in TargetLanguage
-            ],
-        }
-    )
+    return {
+        "settings": cattrs.unstructure(settings),
+        "model_options": {
+            "gemini": GEMINI_MODELS,
+            "openai": OPENAI_MODELS,
+            "anthropic": ANTHROPIC_MODELS,
+            "deepseek": DEEPSEEK_MODELS,
+        },
+        "target_language_options": [
+            cattrs.unstructure(lan.value) for lan in TargetLanguage
+        ],
+    }
 
 
 @router.post("/api/settings")